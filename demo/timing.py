@@ -15,7 +15,7 @@ def get_model(sps, **kwargs):
         sps.update(**kwargs)
     except(AttributeError):
         # For StellarPopulation and CSPBasis objects
-        for k, v in kwargs.iteritems():
+        for k, v in kwargs.items():
             try:
                 sps.params[k] = v
             except:
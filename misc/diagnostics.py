@@ -47,7 +47,7 @@ def diagnostic_plots(sample_file, sps, model_file=None,
         outname = sample_file#''.join(sample_file.split('.')[:-1])
     sample_results, pr, model = read_pickles(sample_file, model_file=model_file,
                                              powell_file=powell_file, inmod=inmod)
-    for k, v in model.params.iteritems():
+    for k, v in model.params.items():
         try:
             sps.params[k] = v
         except KeyError:
@@ -380,7 +380,7 @@ def sample_photometry(sample_results, sps, filterlist,
                       start=0, wthin=16, tthin=10):
 
     chain, model = sample_results['chain'], sample_results['model']
-    for k, v in model.sps_fixed_params.iteritems():
+    for k, v in model.sps_fixed_params.items():
         sps.params[k] = v
     model.filters = filterlist
     nwalkers, nt, ndim = chain.shape
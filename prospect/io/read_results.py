@@ -198,6 +198,8 @@ def read_model(model_file, param_file=('', ''), dangerous=False, **extras):
         for k, v in list(model.theta_index.items()):
             if type(v) is tuple:
                 model.theta_index[k] = slice(*v)
+        # rebuild the cached parameter tables, which older pickles lack
+        model.map_theta()
         powell_results = mod['powell']
 
     return model, powell_results
@@ -320,6 +320,9 @@ def write_obs_to_h5(hf, obs):
                 v = [f.name for f in v]
             except:
                 pass
+        if isinstance(v, np.ndarray) and (v.dtype.kind == 'U'):
+            # e.g. filternames; h5py can not store unicode arrays
+            v = v.tolist()
         if isinstance(v, np.ndarray):
             odat.create_dataset(k, data=v)
         else:
@@ -48,14 +48,17 @@ def lnlike_spec(spec_mu, obs=None, spec_noise=None, f_outlier_spec=0.0, **vector
     vectors['mask'] = mask
     vectors['wavelength'] = obs['wavelength']
 
-    delta = (obs['spectrum'] - spec_mu)[mask]
-    var = (obs['unc'][mask])**2
+    # only the unmasked pixels are used from here on
+    data, mu = obs['spectrum'][mask], spec_mu[mask]
+    delta = data - mu
+    unc = obs['unc'][mask]
+    var = unc * unc
 
     if spec_noise is not None:
         try:
             spec_noise.compute(**vectors)
             if (f_outlier_spec == 0.0):
-                return spec_noise.lnlikelihood(spec_mu[mask], obs['spectrum'][mask])
+                return spec_noise.lnlikelihood(mu, data)
 
             # disallow (correlated noise model + mixture model)
             # and redefine errors
@@ -65,15 +68,11 @@ def lnlike_spec(spec_mu, obs=None, spec_noise=None, f_outlier_spec=0.0, **vector
         except(LinAlgError):
             return np.nan_to_num(-np.inf)
 
-    lnp = -0.5*( (delta**2/var) + np.log(2*np.pi*var) )
     if (f_outlier_spec == 0.0):
-        return lnp.sum()
+        return _lnlike_normal(delta, var)
     else:
-        var_bad = var * (vectors["nsigma_outlier_spec"]**2)
-        lnp_bad = -0.5*( (delta**2/var_bad) + np.log(2*np.pi*var_bad) )
-        lnp_tot = np.logaddexp(lnp + np.log(1-f_outlier_spec), lnp_bad + np.log(f_outlier_spec))
-
-        return lnp_tot.sum()
+        return _lnlike_mixture(delta, var, f_outlier_spec,
+                               nsigma_outlier=vectors.get("nsigma_outlier_spec", 10))
 
 
 def lnlike_phot(phot_mu, obs=None, phot_noise=None, f_outlier_phot=0.0, **vectors):
@@ -118,22 +117,28 @@ def lnlike_phot(phot_mu, obs=None, phot_noise=None, f_outlier_phot=0.0, **vector
         return 0.0
 
     mask = obs.get('phot_mask', slice(None))
-    delta = (obs['maggies'] - phot_mu)[mask]
-    var = (obs['maggies_unc'][mask])**2
+    # only the unmasked bands are used from here on
+    data, mu = obs['maggies'][mask], phot_mu[mask]
+    delta = data - mu
+    unc = obs['maggies_unc'][mask]
+    var = unc * unc
     psamples = obs.get('phot_samples', None)
 
     if phot_noise is not None:
-        try:
-            filternames = obs['filters'].filternames
-        except(AttributeError):
-            filternames = [f.name for f in obs['filters']]
+        # use the filter names cached by rectify_obs, if present
+        filternames = obs.get('filternames', None)
+        if filternames is None:
+            try:
+                filternames = obs['filters'].filternames
+            except(AttributeError):
+                filternames = [f.name for f in obs['filters']]
         vectors['mask'] = mask
-        vectors['filternames'] = np.array(filternames)
+        vectors['filternames'] = np.asarray(filternames)
         vectors['phot_samples'] = psamples
         try:
             phot_noise.compute(**vectors)
             if (f_outlier_phot == 0.0):
-                return phot_noise.lnlikelihood(phot_mu[mask], obs['maggies'][mask])
+                return phot_noise.lnlikelihood(mu, data)
 
             # disallow (correlated noise model + mixture model)
             # and redefine errors
@@ -144,15 +149,66 @@ def lnlike_phot(phot_mu, obs=None, phot_noise=None, f_outlier_phot=0.0, **vector
             return np.nan_to_num(-np.inf)
 
     # simple noise model
-    lnp = -0.5*( (delta**2/var) + np.log(2*np.pi*var) )
     if (f_outlier_phot == 0.0):
-        return lnp.sum()
+        return _lnlike_normal(delta, var)
     else:
-        var_bad = var * (vectors["nsigma_outlier_phot"]**2)
-        lnp_bad = -0.5*( (delta**2/var_bad) + np.log(2*np.pi*var_bad) )
-        lnp_tot = np.logaddexp(lnp + np.log(1-f_outlier_phot), lnp_bad + np.log(f_outlier_phot))
+        return _lnlike_mixture(delta, var, f_outlier_phot,
+                               nsigma_outlier=vectors.get("nsigma_outlier_phot", 10))
+
+
+def _lnlike_normal(delta, var):
+    """Compute the ln-likelihood of a set of residuals given independent
+    gaussian uncertainties.  This is a pure function of the supplied arrays; it
+    does not depend on any model or ``obs`` state.
+
+    :param delta:
+        The (masked) residuals between the data and the model, ndarray of
+        shape ``(ndata,)``
+
+    :param var:
+        The variance of each datum, ndarray of same shape as ``delta``
+
+    :returns lnlikelihood:
+        The natural logarithm of the likelihood, scalar float.
+    """
+    # reduce the chi-square with a single dot product, and pull the constant
+    # part of the normalization out of the sum over data points
+    chisq = np.dot(delta, delta / var)
+    lndet = np.log(var).sum() + var.size * np.log(2*np.pi)
+    return -0.5*( chisq + lndet )
+
+
+def _lnlike_mixture(delta, var, f_outlier, nsigma_outlier=10):
+    """Compute the ln-likelihood of a set of residuals given independent
+    gaussian uncertainties and a mixture model for outliers, in which a
+    fraction ``f_outlier`` of the data are drawn from a gaussian that is
+    ``nsigma_outlier`` times broader.
+
+    :param delta:
+        The (masked) residuals between the data and the model, ndarray of
+        shape ``(ndata,)``
+
+    :param var:
+        The variance of each datum, ndarray of same shape as ``delta``
+
+    :param f_outlier:
+        The fraction of data points which are considered outliers.
+
+    :param nsigma_outlier: (optional, default: 10)
+        The factor by which the uncertainties of the outlier population are
+        inflated relative to ``var``.
+
+    :returns lnlikelihood:
+        The natural logarithm of the likelihood, scalar float.
+    """
+    # the outlier terms are the inlier terms rescaled by nsigma_outlier
+    chisq = delta * delta / var
+    lndet = np.log(2*np.pi*var)
+    lnp = -0.5*( chisq + lndet )
+    lnp_bad = -0.5*( (chisq / nsigma_outlier**2) + lndet ) - np.log(nsigma_outlier)
+    lnp_tot = np.logaddexp(lnp + np.log(1-f_outlier), lnp_bad + np.log(f_outlier))
 
-        return lnp_tot.sum()
+    return lnp_tot.sum()
 
 
 def chi_phot(phot_mu, obs, **extras):
@@ -175,7 +231,7 @@ def chi_phot(phot_mu, obs, **extras):
         return np.array([])
 
     mask = obs.get('phot_mask', slice(None))
-    delta = (obs['maggies'] - phot_mu)[mask]
+    delta = obs['maggies'][mask] - phot_mu[mask]
     unc = obs['maggies_unc'][mask]
     chi = delta / unc
     return chi
@@ -201,7 +257,7 @@ def chi_spec(spec_mu, obs, **extras):
     if obs['spectrum'] is None:
         return np.array([])
     mask = obs.get('mask', slice(None))
-    delta = (obs['spectrum'] - spec_mu)[mask]
+    delta = obs['spectrum'][mask] - spec_mu[mask]
     unc = obs['unc'][mask]
     chi = delta / unc
     return chi
@@ -82,7 +82,7 @@ class NoiseModel(object):
             first_term = np.dot(residual, cho_solve(self.factorized_Sigma,
                                 residual, check_finite=check_finite))
         else:
-            first_term = np.dot(residual**2, 1.0/self.Sigma)
+            first_term = np.dot(residual, residual / self.Sigma)
 
         lnlike = -0.5 * (first_term + self.log_det + n * np.log(2.*np.pi))
 
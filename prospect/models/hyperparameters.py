@@ -45,7 +45,7 @@ class ProspectorHyperParams(ProspectorParams):
             if self.config_dict[p]['isfree']:
                 inds = self.theta_index[p]
                 psd_params[i] = theta[..., inds][0]
-                func = self.config_dict[p]['prior']
+                func = self._theta_prior_dict[p]
                 this_prior = np.sum(func(theta[..., inds]), axis=-1)
                 lnp_prior += this_prior
             else:
@@ -59,10 +59,9 @@ class ProspectorHyperParams(ProspectorParams):
         this_prior = np.sum(np.log(logsfr_ratio_prior.pdf(theta[..., inds])))
         lnp_prior += this_prior
 
-        for k, inds in list(self.theta_index.items()):
+        for k, inds, func in zip(self._theta_names, self._theta_slices, self._theta_priors):
             if (k in hyper_params) or (k == 'logsfr_ratios'):
                 continue
-            func = self.config_dict[k]['prior']
             this_prior = np.sum(func(theta[..., inds]), axis=-1)
             lnp_prior += this_prior
 
@@ -85,10 +84,9 @@ class ProspectorHyperParams(ProspectorParams):
         hyper_params = ['sigma_reg', 'tau_eq', 'tau_in', 'sigma_dyn', 'tau_dyn']
         psd_params = np.zeros(len(hyper_params))
 
-
         for i, p in enumerate(hyper_params):
             if self.config_dict[p]['isfree']:
-                func = self.config_dict[p]['prior'].unit_transform
+                func = self._theta_prior_dict[p].unit_transform
                 inds = self.theta_index[p]
                 psd_params[i] = func(unit_coords[inds])
                 theta[inds] = psd_params[i]
@@ -102,11 +100,10 @@ class ProspectorHyperParams(ProspectorParams):
         logsfr_ratios = logsfr_ratio_prior.unit_transform(x)
         theta[self.theta_index['logsfr_ratios']] = logsfr_ratios
 
-        for k, inds in list(self.theta_index.items()):
+        for k, inds, func in zip(self._theta_names, self._theta_slices, self._theta_priors):
             if (k in hyper_params) or (k == 'logsfr_ratios'):
                 continue
-            func = self.config_dict[k]['prior'].unit_transform
-            theta[inds] = func(unit_coords[inds])
+            theta[inds] = func.unit_transform(unit_coords[inds])
 
         return theta
 
@@ -96,11 +96,9 @@ class ProspectorParams(object):
             If true, empty the params dictionary before re-reading the
             :py:attr:`config_dict`
         """
-        self._has_parameter_dependencies = False
         if (not hasattr(self, 'params')) or reset:
             self.params = {}
 
-        self.map_theta()
         # Propogate initial parameter values from the configure dictionary
         # Populate the 'prior' key of the configure dictionary
         # Check for 'depends_on'
@@ -113,7 +111,8 @@ class ProspectorParams(object):
                 pass
             if info.get('depends_on', None) is not None:
                 assert callable(info["depends_on"])
-                self._has_parameter_dependencies = True
+        # map theta (and cache the priors) only once the 'prior' keys are final
+        self.map_theta()
         # propogate user supplied values to the params state, overriding the
         # configure `init` values
         for k, v in list(kwargs.items()):
@@ -125,6 +124,18 @@ class ProspectorParams(object):
         """Construct the mapping from parameter name to the index in the theta
         vector corresponding to the first element of that parameter.  Called
         during configuration.
+
+        This also caches the names, slices, and prior objects of the free
+        parameters (in theta order), and the names of parameters with
+        dependencies, for use in methods that are called at every posterior
+        evaluation.  These cached priors are used by :py:meth:`prior_product`,
+        :py:meth:`prior_transform`, and :py:meth:`theta_bounds` (including in
+        subclasses), so if prior objects in :py:attr:`config_dict` are
+        replaced after configuration the replacement has no effect until this
+        method is called again.  Likewise this method should be called again
+        if ``depends_on`` is added to or removed from a parameter.  Replacing
+        an existing ``depends_on`` function takes effect immediately, since
+        those are looked up at every call.
         """
         self.theta_index = {}
         count = 0
@@ -141,16 +152,27 @@ class ProspectorParams(object):
                 warnings.warn(msg.format(p, n), RuntimeWarning)
         self.ndim = count
 
+        self._theta_names = tuple(self.theta_index.keys())
+        self._theta_slices = tuple(self.theta_index.values())
+        self._theta_priors = tuple(self.config_dict[p]['prior']
+                                   for p in self._theta_names)
+        self._theta_prior_dict = dict(zip(self._theta_names, self._theta_priors))
+        self._dependent_params = tuple(p for p, info in self.config_dict.items()
+                                       if info.get('depends_on', None) is not None)
+        self._has_parameter_dependencies = len(self._dependent_params) > 0
+
     def set_parameters(self, theta):
         """Propagate theta into the model parameters :py:attr:`params` dictionary.
 
         :param theta:
             A theta parameter vector containing the desired parameters. ndarray
-            of shape ``(ndim,)``
+            of shape ``(ndim,)``.  This is copied once, and the values placed
+            in :py:attr:`params` are views into that copy.
         """
         assert len(theta) == self.ndim
-        for k, inds in list(self.theta_index.items()):
-            self.params[k] = np.atleast_1d(theta[inds]).copy()
+        theta = np.array(theta)
+        for k, inds in zip(self._theta_names, self._theta_slices):
+            self.params[k] = theta[inds]
         self.propagate_parameter_dependencies()
 
     def prior_product(self, theta, nested=False, **extras):
@@ -188,9 +210,8 @@ class ProspectorParams(object):
             parameter values.
         """
         lnp_prior = 0
-        
-        for k, inds in list(self.theta_index.items()):
-            func = self.config_dict[k]['prior']
+
+        for func, inds in zip(self._theta_priors, self._theta_slices):
             this_prior = np.sum(func(theta[..., inds]), axis=-1)
             lnp_prior += this_prior
 
@@ -208,11 +229,9 @@ class ProspectorParams(object):
         """
         theta = np.zeros(len(unit_coords))
 
-        for k, inds in list(self.theta_index.items()):
-            
-            func = self.config_dict[k]['prior'].unit_transform
-            theta[inds] = func(unit_coords[inds])
-        
+        for prior, inds in zip(self._theta_priors, self._theta_slices):
+            theta[inds] = prior.unit_transform(unit_coords[inds])
+
         return theta
 
     def propagate_parameter_dependencies(self):
@@ -222,10 +241,9 @@ class ProspectorParams(object):
         """
         if self._has_parameter_dependencies == False:
             return
-        for p, info in list(self.config_dict.items()):
-            if 'depends_on' in info:
-                value = info['depends_on'](**self.params)
-                self.params[p] = np.atleast_1d(value)
+        for p in self._dependent_params:
+            value = self.config_dict[p]['depends_on'](**self.params)
+            self.params[p] = np.atleast_1d(value)
 
     def rectify_theta(self, theta, epsilon=1e-10):
         """Replace zeros in a given theta vector with a small number epsilon.
@@ -240,7 +258,7 @@ class ProspectorParams(object):
         state dictionary.
         """
         theta = np.zeros(self.ndim)
-        for k, inds in list(self.theta_index.items()):
+        for k, inds in zip(self._theta_names, self._theta_slices):
             theta[inds] = self.params[k]
         return theta
 
@@ -276,7 +294,7 @@ class ProspectorParams(object):
             vector.
         """
         label, index = [], []
-        for p, inds in list(self.theta_index.items()):
+        for p, inds in zip(self._theta_names, self._theta_slices):
             nt = inds.stop - inds.start
             try:
                 name = name_map[p]
@@ -299,13 +317,10 @@ class ProspectorParams(object):
             parameter bounds.
         """
         bounds = np.zeros([self.ndim, 2])
-        for p, inds in list(self.theta_index.items()):
-            pb = self.config_dict[p]['prior'].bounds()
-            bounds[inds, :] = np.array(pb).T
-        # Force types ?
-        bounds = [(np.atleast_1d(a)[0], np.atleast_1d(b)[0])
-                  for a, b in bounds]
-        return bounds
+        for prior, inds in zip(self._theta_priors, self._theta_slices):
+            bounds[inds, :] = np.array(prior.bounds()).T
+        lower, upper = bounds.T
+        return list(zip(lower, upper))
 
     def theta_disps(self, default_disp=0.1, fractional_disp=False):
         """Get a vector of absolute dispersions for each parameter to use in
@@ -324,7 +339,7 @@ class ProspectorParams(object):
             walkers (or minimizers.) ndarray of shape ``(ndim,)``
         """
         disp = np.zeros(self.ndim) + default_disp
-        for par, inds in list(self.theta_index.items()):
+        for par, inds in zip(self._theta_names, self._theta_slices):
             d = self.config_dict[par].get('init_disp', default_disp)
             disp[inds] = d
         if fractional_disp:
@@ -341,7 +356,7 @@ class ProspectorParams(object):
             clouds of walkers (or minimizers.) ndarray of shape ``(ndim,)``
         """
         dfloor = np.zeros(self.ndim)
-        for par, inds in list(self.theta_index.items()):
+        for par, inds in zip(self._theta_names, self._theta_slices):
             d = self.config_dict[par].get('disp_floor', 0.0)
             dfloor[inds] = d
         return dfloor
@@ -350,15 +365,17 @@ class ProspectorParams(object):
         """Clip a set of parameters theta to within the priors.
 
         :param thetas:
-            The parameter vector, ndarray of shape ``(ndim,)``.
+            The parameter vector(s), array-like of shape ``(..., ndim)``.  If
+            this is a float64 ndarray it is clipped in place, otherwise a new
+            float64 array is made.
 
         :returns thetas:
-            The input vector, clipped to the bounds of the priors.
+            The input vector, clipped to the bounds of the priors.  Always use
+            this return value rather than relying on in-place clipping.
         """
-        bounds = self.theta_bounds()
-        for i in range(len(bounds)):
-            lower, upper = bounds[i]
-            thetas[i] = np.clip(thetas[i], lower, upper)
+        thetas = np.asarray(thetas, dtype=float)
+        lower, upper = np.array(self.theta_bounds()).T
+        np.clip(thetas, lower, upper, out=thetas)
 
         return thetas
 
@@ -222,6 +222,29 @@ class Uniform(Prior):
             self.update(**kwargs)
         return self.range
 
+    def __call__(self, x, **kwargs):
+        """Compute the ln-prior-probability at x in closed form, avoiding the
+        overhead of the ``scipy.stats`` machinery.  Values outside the bounds
+        (inclusive) have a ln-prior-probability of ``-inf``, and ``nan`` values
+        of x give ``nan``.  A scalar is returned for scalar x.
+        """
+        if len(kwargs) > 0:
+            self.update(**kwargs)
+        x = np.asarray(x)
+        mini, maxi = self.params['mini'], self.params['maxi']
+        inside = (x >= mini) & (x <= maxi)
+        outside = np.where(np.isnan(x), np.nan, -np.inf)
+        return np.where(inside, np.log(1.0 / (maxi - mini)), outside)[()]
+
+    def gradient(self, theta):
+        """The gradient of the ln-prior-probability with respect to theta.
+        This is zero within the bounds (inclusive), and ``nan`` outside the
+        bounds where the ln-prior-probability is ``-inf``.
+        """
+        theta = np.asarray(theta)
+        inside = (theta >= self.params['mini']) & (theta <= self.params['maxi'])
+        return np.where(inside, 0.0, np.nan)[()]
+
 
 class TopHat(Uniform):
     """Uniform distribution between two bounds, renamed for backwards compatibility
@@ -265,6 +288,22 @@ class Normal(Prior):
         #    self.update(**kwargs)
         return (-np.inf, np.inf)
 
+    def __call__(self, x, **kwargs):
+        """Compute the ln-prior-probability at x in closed form, avoiding the
+        overhead of the ``scipy.stats`` machinery.
+        """
+        if len(kwargs) > 0:
+            self.update(**kwargs)
+        sigma = self.params['sigma']
+        z = (np.asarray(x) - self.params['mean']) / sigma
+        return -0.5 * (z * z + np.log(2 * np.pi)) - np.log(sigma)
+
+    def gradient(self, theta):
+        """The gradient of the ln-prior-probability with respect to theta.
+        """
+        sigma = self.params['sigma']
+        return -(np.asarray(theta) - self.params['mean']) / (sigma * sigma)
+
 
 class MultiVariateNormal(Prior):
     prior_params = ["mean", 'Sigma']
@@ -308,14 +308,13 @@ class SpecModel(ProspectorParams):
             flist = filters.filters
         except(AttributeError):
             flist = filters
+        # lines with zero transmission contribute nothing to the sum
+        elam_elum = elams * elums
         for i, filt in enumerate(flist):
             # calculate transmission at line wavelengths
             trans = np.interp(elams, filt.wavelength, filt.transmission,
                               left=0., right=0.)
-            # include all lines where transmission is non-zero
-            idx = (trans > 0)
-            if True in idx:
-                flux[i] = (trans[idx]*elams[idx]*elums[idx]).sum() / filt.ab_zero_counts
+            flux[i] = np.dot(trans, elam_elum) / filt.ab_zero_counts
 
         return flux
 
@@ -470,19 +469,25 @@ class SpecModel(ProspectorParams):
         alpha_breve = self._eline_lum[idx] * linecal
 
         # FIXME: nebopt: be careful with inverses
-        # generate inverse of sigma_spec
+        # generate inverse of sigma_spec, applied to the gaussians and residuals
         if sigma_spec is None:
-            sigma_spec = obs["unc"]**2
-        sigma_spec = sigma_spec[emask]
+            unc = obs["unc"][emask]
+            sigma_spec = unc * unc
+        else:
+            sigma_spec = sigma_spec[emask]
         if sigma_spec.ndim == 2:
             sigma_inv = np.linalg.pinv(sigma_spec)
+            sigma_inv_gaussians = np.dot(sigma_inv, eline_gaussians)
+            sigma_inv_delta = np.dot(sigma_inv, delta)
         else:
-            sigma_inv = np.diag(1. / sigma_spec)
+            # diagonal, so scale the rows instead of building a dense inverse
+            sigma_inv_gaussians = eline_gaussians / sigma_spec[:, None]
+            sigma_inv_delta = delta / sigma_spec
 
         # calculate ML emission line amplitudes and covariance matrix
         # FIXME: nebopt: do this with a solve
-        sigma_alpha_hat = np.linalg.pinv(np.dot(eline_gaussians.T, np.dot(sigma_inv, eline_gaussians)))
-        alpha_hat = np.dot(sigma_alpha_hat, np.dot(eline_gaussians.T, np.dot(sigma_inv, delta)))
+        sigma_alpha_hat = np.linalg.pinv(np.dot(eline_gaussians.T, sigma_inv_gaussians))
+        alpha_hat = np.dot(sigma_alpha_hat, np.dot(eline_gaussians.T, sigma_inv_delta))
 
         # generate likelihood penalty term (and MAP amplitudes)
         # FIXME: Cache line amplitude covariance matrices?
@@ -698,8 +703,8 @@ class PolySpecModel(SpecModel):
                 ATA += reg**2 * np.eye(order+1)
             ATAinv = np.linalg.inv(ATA)
             c = np.dot(ATAinv, np.dot(A.T, y / yvar))
-            Afull = chebvander(x, order)
-            poly = np.dot(Afull, c)
+            # evaluate via Clenshaw recursion, no (nwave, order+1) design matrix
+            poly = chebval(x, c)
             self._poly_coeffs = c
         else:
             poly = np.zeros_like(self._outwave)
@@ -880,14 +885,13 @@ class LineSpecModel(SpecModel):
             flist = filters.filters
         except(AttributeError):
             flist = filters
+        # lines with zero transmission contribute nothing to the sum
+        elam_elum = elams * elums
         for i, filt in enumerate(flist):
             # calculate transmission at line wavelengths
             trans = np.interp(elams, filt.wavelength, filt.transmission,
                               left=0., right=0.)
-            # include all lines where transmission is non-zero
-            idx = (trans > 0)
-            if True in idx:
-                flux[i] = (trans[idx]*elams[idx]*elums[idx]).sum() / filt.ab_zero_counts
+            flux[i] = np.dot(trans, elam_elum) / filt.ab_zero_counts
 
         return flux
 
@@ -1074,7 +1078,10 @@ class SedModel(ProspectorParams):
 
     def predict(self, theta, obs=None, sps=None, **extras):
         """Given a ``theta`` vector, generate a spectrum, photometry, and any
-        extras (e.g. stellar mass), including any calibration effects.
+        extras (e.g. stellar mass), including any calibration effects.  The
+        calibration is applied out of place, so that ``_spec`` remains the
+        uncalibrated spectrum; subclasses overriding this method must not
+        modify the output of :py:meth:`sed` in place.
 
         :param theta:
             ndarray of parameter values, of shape ``(ndim,)``
@@ -1112,14 +1119,16 @@ class SedModel(ProspectorParams):
         if obs.get('logify_spectrum', False):
             s = np.log(s) + np.log(self._speccal)
         else:
-            s *= self._speccal
+            s = s * self._speccal
         return s, p, x
 
     def sed(self, theta, obs=None, sps=None, **kwargs):
         """Given a vector of parameters ``theta``, generate a spectrum, photometry,
         and any extras (e.g. surviving mass fraction), ***not** including any
         instrument calibration effects.  The intrinsic spectrum thus produced is
-        cached in `_spec` attribute
+        cached in the `_spec` attribute.  This is the *same* array as the
+        returned spectrum, not a copy, so callers must not modify the returned
+        spectrum in place.
 
         :param theta:
             ndarray of parameter values.
@@ -1155,15 +1164,19 @@ class SedModel(ProspectorParams):
                                               lnwavegrid=obs.get('lnwavegrid', None),
                                               **self.params)
 
-        spec *= obs.get('normalization_guess', 1.0)
-        # Remove negative fluxes.
+        norm = obs.get('normalization_guess', None)
+        if norm is not None:
+            spec *= norm
+        # Remove negative fluxes, in place.
         try:
-            tiny = 1.0 / len(spec) * spec[spec > 0].min()
-            spec[spec < tiny] = tiny
-        except:
+            tiny = np.min(spec, where=spec > 0, initial=np.inf) / len(spec)
+            if np.isfinite(tiny):
+                np.maximum(spec, tiny, out=spec)
+        except(TypeError, ValueError):
             pass
-        spec = (spec + self.sky(obs))
-        self._spec = spec.copy()
+        spec += self.sky(obs)
+        # ``predict`` does not modify this array, so it need not be copied
+        self._spec = spec
         return spec, phot, extras
 
     def sky(self, obs):
@@ -1247,8 +1260,8 @@ class PolySedModel(SedModel):
                 ATA += reg**2 * np.eye(order)
             ATAinv = np.linalg.inv(ATA)
             c = np.dot(ATAinv, np.dot(A.T, y / yvar))
-            Afull = chebvander(x, order)[:, 1:]
-            poly = np.dot(Afull, c)
+            # evaluate via Clenshaw recursion, with the zeroth term set to 0
+            poly = chebval(x, np.insert(c, 0, 0))
             self._poly_coeffs = c
         else:
             poly = 0.0
@@ -1354,6 +1367,12 @@ def gauss(x, mu, A, sigma):
     :returns val:
         The values of the sum of gaussians at x.
     """
-    mu, A, sigma = np.atleast_2d(mu), np.atleast_2d(A), np.atleast_2d(sigma)
-    val = A / (sigma * np.sqrt(np.pi * 2)) * np.exp(-(x[:, None] - mu)**2 / (2 * sigma**2))
+    mu, A, sigma = np.broadcast_arrays(np.atleast_2d(mu), np.atleast_2d(A),
+                                       np.atleast_2d(sigma))
+    # build the (nx, ngauss) array once and operate on it in place
+    val = np.subtract(x[:, None], mu, dtype=float)
+    val *= val
+    val /= -2 * sigma**2
+    np.exp(val, out=val)
+    val *= A / (sigma * np.sqrt(np.pi * 2))
     return val.sum(axis=-1)
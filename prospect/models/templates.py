@@ -29,10 +29,8 @@ class Directory(object):
     def __init__(self):
         self._entries = {}
         self._descriptions = {}
-        try:
-            self.iteritems = self._entries.iteritems
-        except AttributeError:
-            self.iteritems = self._entries.items
+        # kept for backwards compatibility
+        self.iteritems = self._entries.items
 
     def __getitem__(self, k):
         return deepcopy(self._entries[k])
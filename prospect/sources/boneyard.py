@@ -139,8 +139,9 @@ class CSPBasis(object):
         # now some mass normalization magic
         mfrac = self.csp.stellar_mass
         if np.all(self.params.get('mass_units', 'mstar') == 'mstar'):
-            # Convert input normalization units from per stellar masss to per mass formed
-            mass /= mfrac
+            # Convert input normalization units from per stellar masss to per
+            # mass formed, without modifying the (possibly shared) mass parameter
+            mass = mass / mfrac
         # Output correct units
         return mass * sa, mass * phot, mfrac
 
@@ -182,8 +183,8 @@ class StepSFHBasis(SSPBasis):
             # here as well as in get_spectrum because the *relative*
             # normalization in each bin depends on the units, as well as the
             # overall normalization.
-            bin_masses /= self.bin_mass_fraction
-        w = (bin_masses[:, None] * self._bin_weights).sum(axis=0)
+            bin_masses = bin_masses / self.bin_mass_fraction
+        w = np.dot(bin_masses, self._bin_weights)
 
         return w
 
@@ -194,7 +195,7 @@ class StepSFHBasis(SSPBasis):
         try:
             mstar = self.ssp_stellar_masses
             w = self._bin_weights
-            bin_mfrac = (mstar[None, :] * w).sum(axis=-1) / w.sum(axis=-1)
+            bin_mfrac = np.dot(w, mstar) / w.sum(axis=-1)
             return bin_mfrac
         except(AttributeError):
             print('agebin info or ssp masses not chached?')
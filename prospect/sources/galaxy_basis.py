@@ -274,7 +274,12 @@ class MultiComponentCSPBasis(CSPSpecBasis):
 def gauss(x, mu, A, sigma):
     """Lay down mutiple gaussians on the x-axis.
     """
-    mu, A, sigma = np.atleast_2d(mu), np.atleast_2d(A), np.atleast_2d(sigma)
-    val = (A / (sigma * np.sqrt(np.pi * 2)) *
-           np.exp(-(x[:, None] - mu)**2 / (2 * sigma**2)))
+    mu, A, sigma = np.broadcast_arrays(np.atleast_2d(mu), np.atleast_2d(A),
+                                       np.atleast_2d(sigma))
+    # build the (nx, ngauss) array once and operate on it in place
+    val = np.subtract(x[:, None], mu, dtype=float)
+    val *= val
+    val /= -2 * sigma**2
+    np.exp(val, out=val)
+    val *= A / (sigma * np.sqrt(np.pi * 2))
     return val.sum(axis=-1)
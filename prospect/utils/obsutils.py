@@ -52,8 +52,9 @@ def fix_obs(obs, rescale_spectrum=False, normalize_spectrum=False,
         if (rescale_spectrum):
             sc = np.median(obs['spectrum'][obs['mask']])
             obs['rescale'] = sc
-            obs['spectrum'] /= sc
-            obs['unc'] /= sc
+            # new arrays, so the caller's data are not modified in place
+            obs['spectrum'] = obs['spectrum'] / sc
+            obs['unc'] = obs['unc'] / sc
         if (normalize_spectrum):
             sp_norm, pivot_wave = norm_spectrum(obs, **kwargs)
             obs['normalization_guess'] = sp_norm
@@ -97,6 +98,7 @@ def logify_data(data, sigma, mask):
                    "positivity.".format(nbad, tiny))
         # warnings.warn(message)
         print(message)
+        data, sigma = data.copy(), sigma.copy()
         data[bad] = tiny
         sigma[bad] = np.sqrt(sigma[bad]**2 + (data[bad] - tiny)**2)
         return np.log(data), sigma/data, mask
@@ -161,9 +163,9 @@ def rectify_obs(obs):
                             np.isfinite(obs['maggies_unc']) *
                             (obs['maggies_unc'] > 0))
         try:
-            obs['filternames'] = obs["filters"].filternames
+            obs['filternames'] = np.array(obs["filters"].filternames)
         except(AttributeError):
-            obs['filternames'] = [f.name for f in obs['filters']]
+            obs['filternames'] = np.array([f.name for f in obs['filters']])
         except:
             pass
 
@@ -0,0 +1,51 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import numpy as np
+
+from prospect.likelihood import lnlike_spec, lnlike_phot
+
+
+def build_obs(n=50, seed=42):
+    rng = np.random.default_rng(seed)
+    obs = dict(wavelength=np.linspace(4000, 6000, n),
+               spectrum=1.0 + rng.normal(0, 0.1, n),
+               unc=np.full(n, 0.1),
+               mask=np.ones(n, dtype=bool),
+               maggies=rng.uniform(1, 2, 5),
+               maggies_unc=np.full(5, 0.05),
+               phot_mask=np.ones(5, dtype=bool))
+    obs["mask"][:5] = False
+    return obs
+
+
+def test_lnlike_normal():
+    obs = build_obs()
+    mu = np.ones_like(obs["spectrum"])
+    m = obs["mask"]
+    delta = (obs["spectrum"] - mu)[m]
+    var = obs["unc"][m]**2
+    expected = -0.5 * np.sum(delta**2 / var + np.log(2 * np.pi * var))
+    assert np.allclose(lnlike_spec(mu, obs=obs), expected)
+
+    phot = np.ones(5)
+    delta = obs["maggies"] - phot
+    var = obs["maggies_unc"]**2
+    expected = -0.5 * np.sum(delta**2 / var + np.log(2 * np.pi * var))
+    assert np.allclose(lnlike_phot(phot, obs=obs), expected)
+
+
+def test_lnlike_outliers():
+    obs = build_obs()
+    mu = np.ones_like(obs["spectrum"])
+    m, f, nsig = obs["mask"], 0.1, 5.0
+    delta = (obs["spectrum"] - mu)[m]
+    var = obs["unc"][m]**2
+    lnp = -0.5 * (delta**2 / var + np.log(2 * np.pi * var))
+    var_bad = var * nsig**2
+    lnp_bad = -0.5 * (delta**2 / var_bad + np.log(2 * np.pi * var_bad))
+    expected = np.logaddexp(lnp + np.log(1 - f), lnp_bad + np.log(f)).sum()
+    lnp_spec = lnlike_spec(mu, obs=obs, f_outlier_spec=f,
+                           nsigma_outlier_spec=nsig)
+    assert np.allclose(lnp_spec, expected)
+
@@ -0,0 +1,31 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import numpy as np
+
+from prospect.utils.obsutils import fix_obs, logify_data
+
+
+def test_fix_obs_rescale():
+    spec = np.linspace(1.0, 2.0, 20)
+    unc = np.full(20, 0.1)
+    orig = spec.copy()
+    obs = dict(wavelength=np.linspace(4000, 6000, 20), spectrum=spec,
+               unc=unc, maggies=None)
+    obs = fix_obs(obs, rescale_spectrum=True)
+    assert np.allclose(spec, orig)
+    assert np.allclose(obs["spectrum"] * obs["rescale"], orig)
+    assert np.allclose(obs["unc"] * obs["rescale"], unc)
+
+
+def test_logify_data():
+    data = np.array([-1.0, 0.0, 1e-6, 1.0, 2.0])
+    sigma = np.full(5, 0.1)
+    mask = np.ones(5, dtype=bool)
+    orig_data, orig_sigma = data.copy(), sigma.copy()
+    lndata, lnsigma, lnmask = logify_data(data, sigma, mask)
+    # the caller's arrays are not modified
+    assert np.all(data == orig_data)
+    assert np.all(sigma == orig_sigma)
+    assert np.all(np.isfinite(lndata)) & np.all(np.isfinite(lnsigma))
+    assert np.allclose(lndata[3:], np.log(orig_data[3:]))
@@ -0,0 +1,117 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import numpy as np
+
+from prospect.models import ProspectorParams, priors
+
+
+def build_model():
+    model_params = {"mass": {"N": 2, "isfree": True, "init": np.array([1e10, 1e9]),
+                             "prior": priors.LogUniform(mini=np.full(2, 1e8),
+                                                      maxi=np.full(2, 1e12))},
+                    "logzsol": {"N": 1, "isfree": True, "init": -0.5,
+                                "prior": priors.TopHat(mini=-2, maxi=0.2)},
+                    "dust2": {"N": 1, "isfree": True, "init": 0.3,
+                              "prior": priors.Normal(mean=0.3, sigma=0.2)},
+                    "zred": {"N": 1, "isfree": False, "init": 0.1}}
+    return ProspectorParams(model_params, param_order=["mass", "logzsol", "dust2", "zred"])
+
+
+def test_clip_to_bounds():
+    model = build_model()
+    theta = np.array([1e7, 1e13, 0.5, 10.0])
+    clipped = model.clip_to_bounds(theta.copy())
+    assert np.allclose(clipped, [1e8, 1e12, 0.2, 10.0])
+
+    # a set of vectors should be clipped by parameter, not by vector
+    thetas = np.array([theta, model.theta])
+    clipped = model.clip_to_bounds(thetas.copy())
+    assert np.allclose(clipped[0], [1e8, 1e12, 0.2, 10.0])
+    assert np.allclose(clipped[1], model.theta)
+
+    # lists and integer arrays are converted rather than clipped in place
+    clipped = model.clip_to_bounds([0, 0, 1, 0])
+    assert np.allclose(clipped, [1e8, 1e8, 0.2, 0.0])
+    clipped = model.clip_to_bounds(np.array([0, 0, 1, 0]))
+    assert np.allclose(clipped, [1e8, 1e8, 0.2, 0.0])
+
+
+def test_prior_product():
+    import scipy.stats
+    model = build_model()
+    theta = model.theta.copy()
+    expected = (np.sum(scipy.stats.reciprocal.logpdf(theta[:2], 1e8, 1e12)) +
+                scipy.stats.uniform.logpdf(theta[2], loc=-2, scale=2.2) +
+                scipy.stats.norm.logpdf(theta[3], loc=0.3, scale=0.2))
+    assert np.allclose(model.prior_product(theta), expected)
+
+    # out of bounds
+    theta[2] = 0.5
+    assert not np.isfinite(model.prior_product(theta))
+
+    # vectorized over many theta
+    thetas = np.array([model.theta, theta])
+    lnp = model.prior_product(thetas)
+    assert lnp.shape == (2,)
+    assert np.allclose(lnp[0], expected) & (not np.isfinite(lnp[1]))
+
+
+def test_set_parameters():
+    model = build_model()
+    theta = np.array([2e10, 3e9, -1.0, 0.1])
+    model.set_parameters(theta)
+    assert np.allclose(model.theta, theta)
+    assert model.params["mass"].shape == (2,)
+    assert model.params["logzsol"].shape == (1,)
+
+    # parameters should not be tied to the input vector
+    theta[:] = 0
+    assert np.allclose(model.params["mass"], [2e10, 3e9])
+
+
+def test_parameter_dependencies():
+    model_params = {"logmass": {"N": 1, "isfree": True, "init": 10.0,
+                                "prior": priors.TopHat(mini=8, maxi=12)},
+                    "mass": {"N": 1, "isfree": False, "init": 1e10,
+                             "depends_on": lambda logmass=0, **extras: 10**logmass},
+                    "zred": {"N": 1, "isfree": False, "init": 0.1,
+                             "depends_on": None}}
+    model = ProspectorParams(model_params)
+    model.set_parameters(np.array([11.0]))
+    assert np.allclose(model.params["mass"], 1e11)
+    assert np.allclose(model.params["zred"], 0.1)
+
+    # dependencies added after configuration are used once re-mapped
+    model_params["mass"].pop("depends_on")
+    model = ProspectorParams(model_params)
+    model.set_parameters(np.array([11.0]))
+    assert np.allclose(model.params["mass"], 1e10)
+    model.config_dict["mass"]["depends_on"] = lambda logmass=0, **extras: 10**logmass
+    model.map_theta()
+    model.set_parameters(np.array([11.0]))
+    assert np.allclose(model.params["mass"], 1e11)
+
+
+def test_theta_bounds():
+    model = build_model()
+    bounds = model.theta_bounds()
+    assert len(bounds) == model.ndim
+    assert np.allclose(bounds[:3], [(1e8, 1e12), (1e8, 1e12), (-2, 0.2)])
+    assert bounds[3] == (-np.inf, np.inf)
+
+
+def test_cached_priors():
+    # the legacy 'prior_function' key should override 'prior'
+    model_params = {"x": {"N": 1, "isfree": True, "init": 0.5,
+                          "prior": priors.TopHat(mini=0, maxi=1),
+                          "prior_function": priors.TopHat(mini=0, maxi=10)}}
+    model = ProspectorParams(model_params)
+    assert np.allclose(model.prior_product(np.array([5.0])), np.log(0.1))
+    assert model.theta_bounds() == [(0, 10)]
+
+    # replaced priors are used once the theta map is rebuilt
+    model.config_dict["x"]["prior"] = priors.TopHat(mini=0, maxi=2)
+    model.map_theta()
+    assert not np.isfinite(model.prior_product(np.array([5.0])))
+    assert model.theta_bounds() == [(0, 2)]
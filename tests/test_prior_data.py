@@ -8,3 +8,24 @@ def test_nzsfh_prior():
                     logsfr_ratio_mini=-5.0, logsfr_ratio_maxi=5.0,
                     logsfr_ratio_tscale=0.3, nbins_sfh=7,
                     const_phi=True)
+
+
+def test_uniform_normal_gradient():
+   import numpy as np
+   from prospect.models import priors
+   prior = priors.TopHat(mini=np.zeros(2), maxi=np.ones(2))
+   assert np.all(prior([0.5, 0.5]) == 0.0)
+   assert not np.any(np.signbit(prior([0.5, 0.5])))
+   assert np.all(np.isnan(prior([np.nan, np.nan])))
+   grad = prior.gradient([0.5, 2.0])
+   assert (grad[0] == 0.0) & np.isnan(grad[1])
+
+   prior = priors.TopHat(mini=0.0, maxi=2.0)
+   lnp = prior(1.0)
+   assert np.isscalar(lnp) & np.allclose(lnp, np.log(0.5))
+   assert np.isnan(prior(np.nan)) & (prior(3.0) == -np.inf)
+
+   prior = priors.Normal(mean=1.0, sigma=2.0)
+   x, dx = np.array([-1.0, 0.5, 3.0]), 1e-6
+   numerical = (prior(x + dx) - prior(x - dx)) / (2 * dx)
+   assert np.allclose(prior.gradient(x), numerical)
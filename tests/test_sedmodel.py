@@ -0,0 +1,28 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import numpy as np
+
+from prospect.models import priors
+from prospect.models.sedmodel import SedModel
+
+
+class FlatSPS(object):
+    """A minimal sps object giving a flat spectrum scaled by mass."""
+
+    def get_spectrum(self, outwave=None, filters=None, **params):
+        spec = np.full(len(outwave), float(params["mass"][0]))
+        return spec, np.zeros(1), None
+
+
+def test_predict_caches_uncalibrated_spec():
+    model_params = {"mass": {"N": 1, "isfree": True, "init": 2.0,
+                             "prior": priors.TopHat(mini=0, maxi=10)},
+                    "spec_norm": {"N": 1, "isfree": True, "init": 3.0,
+                                  "prior": priors.TopHat(mini=0, maxi=10)}}
+    model = SedModel(model_params)
+    obs = dict(wavelength=np.linspace(4000, 6000, 10), filters=None)
+    spec, phot, extras = model.predict(model.theta, obs=obs, sps=FlatSPS())
+    assert np.allclose(spec, 6.0)
+    # the cached spectrum should not have the calibration applied
+    assert np.allclose(model._spec, 2.0)
@@ -0,0 +1,17 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import numpy as np
+
+from prospect.sources import StepSFHBasis
+
+
+def test_stepsfh_mass_unchanged():
+    sps = StepSFHBasis(zcontinuous=1)
+    mass = np.array([1e8, 1e9, 1e10])
+    params = dict(agebins=np.array([[0., 8.], [8., 9.], [9., 10.]]),
+                  mass=mass.copy(), mass_units="mstar", logzsol=-0.3)
+    sps.get_galaxy_spectrum(**params)
+    # converting to mass formed should not rescale the input mass parameter
+    assert np.all(params["mass"] == mass)
+    assert np.all(sps.params["mass"] == mass)